@@ -34,7 +34,11 @@ class PartialPrepend(partial):
 
     """  # noqa: E501
 
-    def __call__(self, *args, **keywords):
+    # NOTE: `__self` is mangled, thus allowing `self` to be passed as keyword argument
+    def __call__(__self, *args, **keywords):
         """Call and return :attr:`~PartialReversed.func`."""
-        keywords = {**self.keywords, **keywords}
-        return self.func(*args, *self.args, **keywords)
+        if not keywords:
+            keywords = __self.keywords
+        elif __self.keywords:
+            keywords = {**__self.keywords, **keywords}
+        return __self.func(*args, *__self.args, **keywords)
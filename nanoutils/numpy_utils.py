@@ -50,6 +50,7 @@ __all__ = [
     'as_nd_array',
     'array_combinations',
     'fill_diagonal_blocks',
+    'group_by_values_np',
     'DTypeMapping',
     'MutableDTypeMapping',
 ]
@@ -253,4 +254,64 @@ def fill_diagonal_blocks(
         j0 += j
 
 
+@raise_if(NUMPY_EX)
+def group_by_values_np(values: ArrayLike, keys: ArrayLike) -> dict[Any, np.ndarray]:
+    r"""Group all elements in **values** by their respective element in **keys**.
+
+    A vectorized counterpart of :func:`~nanoutils.group_by_values` for array-like objects.
+
+    Examples
+    --------
+    .. doctest:: python
+        :skipif: NUMPY_EX is not None
+
+        >>> import numpy as np
+        >>> from nanoutils import group_by_values_np
+
+        >>> values = np.arange(1, 10)
+        >>> keys = np.array(['a', 'a', 'a', 'a', 'a', 'b', 'b', 'b', 'c'])
+
+        >>> dct = group_by_values_np(values, keys)
+        >>> for k, v in dct.items():
+        ...     print(repr(k), v)
+        'a' [1 2 3 4 5]
+        'b' [6 7 8]
+        'c' [9]
+
+    Parameters
+    ----------
+    values : array-like, shape :math:`(n, \dotsc)`
+        An array-like object whose elements along the first axis will be grouped.
+    keys : array-like, shape :math:`(n,)`
+        A 1D array-like object with the keys of all elements in **values**.
+
+    Returns
+    -------
+    :class:`dict[Any, numpy.ndarray]<typing.dict>`
+        A grouped dictionary.
+        The (sorted) keys are converted into their respective Python objects,
+        while the values are views of a single array.
+
+    See Also
+    --------
+    :func:`nanoutils.group_by_values`
+        Take an iterable, yielding 2-tuples, and group all first elements by the second.
+
+    """
+    values_ar = np.asarray(values)
+    keys_ar = np.asarray(keys)
+    if keys_ar.ndim != 1:
+        raise ValueError(f"'keys' expected a 1D array; observed dimensionality: {keys_ar.ndim}")
+    elif values_ar.shape[:1] != keys_ar.shape:
+        raise ValueError("'values' and 'keys' should be of the same length along axis 0; "
+                         f"observed shapes: {values_ar.shape} & {keys_ar.shape}")
+
+    # Sort the keys (using a stable algorithm in order to preserve the order
+    # of the values) and identify the boundaries between unique keys
+    idx = np.argsort(keys_ar, kind="stable")
+    keys_unique, idx_start = np.unique(keys_ar[idx], return_index=True)
+    values_split = np.split(values_ar[idx], idx_start[1:])
+    return dict(zip(keys_unique.tolist(), values_split))
+
+
 __doc__ = construct_api_doc(globals())
@@ -17,12 +17,15 @@ API
 from __future__ import annotations
 
 import re
+import sys
 import warnings
 import importlib
 import inspect
 import functools
 from types import ModuleType
 from functools import wraps
+from itertools import filterfalse
+from collections import defaultdict
 from typing import (
     Any,
     TypeVar,
@@ -37,6 +40,7 @@ from collections.abc import (
     Mapping,
     MutableMapping,
     Collection,
+    Sequence,
 )
 
 from .typing_utils import Literal
@@ -133,22 +137,21 @@ def get_func_name(
         A string representation of the name of **func**.
 
     """
-    try:
-        name: str = getattr(func, '__qualname__', func.__name__)
-    except AttributeError as ex:
+    # Objects without `__name__` use the fallback even if they have a `__qualname__`
+    name: None | str = getattr(func, '__name__', None)
+    if name is not None:
+        name = getattr(func, '__qualname__', name)
+    else:
         if not callable(func):
             raise TypeError("'func' expected a callable; "
-                            f"observed type: {func.__class__.__name__!r}") from ex
+                            f"observed type: {func.__class__.__name__!r}")
         if repr_fallback:
             name = repr(func)
         else:
             name = f'{func.__class__.__name__}(...)'
 
-    if prepend_module:
-        try:
-            return f'{func.__module__}.{name}'
-        except AttributeError:
-            pass
+    if prepend_module and hasattr(func, '__module__'):
+        return f'{func.__module__}.{name}'
     return name
 
 
@@ -180,15 +183,10 @@ def group_by_values(iterable: Iterable[tuple[_VT, _KT]]) -> dict[_KT, list[_VT]]
         A grouped dictionary.
 
     """
-    ret = {}
-    list_append: dict[_KT, Callable[[_VT], None]] = {}
+    ret: defaultdict[_KT, list[_VT]] = defaultdict(list)
     for value, key in iterable:
-        try:
-            list_append[key](value)
-        except KeyError:
-            ret[key] = [value]
-            list_append[key] = ret[key].append
-    return ret
+        ret[key].append(value)
+    return dict(ret)
 
 
 def set_docstring(docstring: None | str) -> Callable[[_FT], _FT]:
@@ -250,16 +248,11 @@ def get_importable(string: str, validate: None | Callable[[_T], bool] = None) ->
         The imported object
 
     """
-    try:
-        head, *tail = string.split('.')
-    except (AttributeError, TypeError) as ex:
+    if not isinstance(string, str):
         raise TypeError("'string' expected a str; observed type: "
-                        f"{string.__class__.__name__!r}") from ex
-
-    ret: _T = importlib.import_module(head)  # type: ignore
-    for name in tail:
-        ret = getattr(ret, name)
+                        f"{string.__class__.__name__!r}")
 
+    ret: _T = _get_importable(string)
     if validate is None:
         return ret
     elif not validate(ret):
@@ -268,6 +261,36 @@ def get_importable(string: str, validate: None | Callable[[_T], bool] = None) ->
     return ret
 
 
+def _get_importable(string: str) -> Any:
+    """A helper function for :func:`get_importable`."""
+    # Many importable strings are plain module names
+    ret = sys.modules.get(string)
+    if ret is not None:
+        return ret
+
+    head, *tail = string.split('.')
+    ret = sys.modules.get(head)
+    if ret is None:
+        ret = importlib.import_module(head)
+
+    # Walk the attributes and only fall back to importing a submodule
+    # if the parent module does not (yet) expose it
+    for name in tail:
+        try:
+            ret = getattr(ret, name)
+        except AttributeError as ex:
+            if not isinstance(ret, ModuleType):
+                raise
+            module_name = f"{ret.__name__}.{name}"
+            try:
+                ret = importlib.import_module(module_name)
+            except ModuleNotFoundError as ex2:
+                if ex2.name != module_name:
+                    raise
+                raise ex from None
+    return ret
+
+
 @overload
 def split_dict(
     dct: MutableMapping[_KT, _VT],
@@ -344,7 +367,10 @@ def split_dict(
     else:
         raise TypeError("'keep_keys' and 'disgard_keys' cannot both be specified")
 
-    return {k: dct.pop(k) for k in iterable}
+    # Pop the keys in a single pass; for `dict` this is cheaper than
+    # separate `__getitem__` and `__delitem__` passes
+    pop = dct.pop
+    return {k: pop(k) for k in iterable}
 
 
 def _keep_keys(
@@ -354,7 +380,9 @@ def _keep_keys(
 ) -> Collection[_KT]:
     """A helper function for :func:`split_dict`; used when :code:`keep_keys is not None`."""
     if preserve_order:
-        return [k for k in dct if k not in keep_keys]
+        if not isinstance(keep_keys, (set, frozenset)):
+            keep_keys = frozenset(keep_keys)
+        return list(filterfalse(keep_keys.__contains__, dct))
     else:
         try:
             return dct.keys() - keep_keys
@@ -369,7 +397,9 @@ def _disgard_keys(
 ) -> Collection[_KT]:
     """A helper function for :func:`split_dict`; used when :code:`disgard_keys is not None`."""
     if preserve_order:
-        return [k for k in dct if k in keep_keys]
+        if not isinstance(keep_keys, (set, frozenset)):
+            keep_keys = frozenset(keep_keys)
+        return list(filter(keep_keys.__contains__, dct))
     else:
         try:
             return dct.keys() & keep_keys
@@ -547,6 +577,7 @@ _PATTERN = re.compile(
     r"^\s*" + _PATTERN_STR + r"\s*$",
     re.VERBOSE | re.IGNORECASE,
 )
+_RELEASE_PATTERN = re.compile(r"([0-9]+)\.([0-9]+)\.([0-9]+)")
 
 
 class VersionInfo(NamedTuple):
@@ -617,10 +648,21 @@ class VersionInfo(NamedTuple):
             and declaring dependencies on particular versions.
 
         """
-        match = _PATTERN.fullmatch(version) if fullmatch else _PATTERN.match(version)
-        if match is None:
-            raise ValueError(f"Failed to parse {version!r}")
-        return cls._make(int(i) for i in match["release"].split(".")[:3])
+        return cls(*_parse_version(version, fullmatch))
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_version(version: str, fullmatch: bool = True) -> tuple[int, ...]:
+    """A cached helper function for :meth:`VersionInfo.from_str`."""
+    # Fast path for plain `major.minor.micro` strings (e.g. `"0.8.2"`)
+    match = _RELEASE_PATTERN.fullmatch(version)
+    if match is not None:
+        return int(match[1]), int(match[2]), int(match[3])
+
+    match = _PATTERN.fullmatch(version) if fullmatch else _PATTERN.match(version)
+    if match is None:
+        raise ValueError(f"Failed to parse {version!r}")
+    return tuple(map(int, match["release"].split(".")[:3]))
 
 
 def _get_directive(
@@ -718,9 +760,13 @@ def construct_api_doc(
     __doc__ = cast(str, glob_dict['__doc__'])
     __all__ = cast("list[str]", glob_dict['__all__'])
 
+    # Ensure `O(1)` membership tests when a list or tuple of names is passed
+    if isinstance(decorators, Sequence) and not isinstance(decorators, str):
+        decorators = frozenset(decorators)
+
     return __doc__.format(
-        autosummary='\n'.join(f'    {i}' for i in __all__),
-        autofunction='\n'.join(_get_directive(glob_dict[i], i, decorators) for i in __all__)
+        autosummary='    ' + '\n    '.join(__all__) if __all__ else '',
+        autofunction='\n'.join([_get_directive(glob_dict[i], i, decorators) for i in __all__]),
     )
 
 
@@ -14,7 +14,6 @@ API
 
 from __future__ import annotations
 
-from collections.abc import Hashable
 from typing import Dict, Any, IO
 
 from .utils import raise_if
@@ -76,17 +75,18 @@ class UniqueLoader(Loader):
         mapping = {}
         for key_node, value_node in node.value:
             key = self.construct_object(key_node, deep=deep)
-            if not isinstance(key, Hashable):
+            try:
+                is_duplicate = key in mapping
+            except TypeError:
                 raise yaml.constructor.ConstructorError(
                     "while constructing a mapping", node.start_mark,
                     "found unhashable key", key_node.start_mark,
-                )
-            elif key in mapping:
+                ) from None
+
+            if is_duplicate:
                 raise yaml.constructor.ConstructorError(
                     "while constructing a mapping", node.start_mark,
                     "found a duplicate key", key_node.start_mark,
                 )
-
-            value = self.construct_object(value_node, deep=deep)
-            mapping[key] = value
+            mapping[key] = self.construct_object(value_node, deep=deep)
         return mapping
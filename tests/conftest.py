@@ -0,0 +1,29 @@
+"""Shared fixtures for the nanoutils tests."""
+
+from __future__ import annotations
+
+import builtins
+from typing import TYPE_CHECKING
+from collections.abc import Callable
+
+import pytest
+
+if TYPE_CHECKING:
+    import _pytest
+
+
+@pytest.fixture(scope="session")
+def pretty() -> Callable[[object], str]:
+    ipython_pretty = pytest.importorskip("IPython.lib.pretty")
+    ret: Callable[[object], str] = ipython_pretty.pretty
+    return ret
+
+
+@pytest.fixture
+def str_func(request: _pytest.fixtures.SubRequest) -> Callable[[object], str]:
+    name: str = request.param
+    if name == "pretty":
+        ret: Callable[[object], str] = request.getfixturevalue("pretty")
+    else:
+        ret = getattr(builtins, name)
+    return ret
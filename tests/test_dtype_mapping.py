@@ -18,14 +18,6 @@ if TYPE_CHECKING:
     import numpy.typing as npt
     import _pytest
 
-try:
-    from IPython.lib.pretty import pretty
-except ModuleNotFoundError:
-    IPYTHON: bool = False
-    pretty = NotImplemented
-else:
-    IPYTHON = True
-
 
 class BasicMapping:
     def __init__(self, dct: dict[str, npt.DTypeLike]) -> None:
@@ -49,6 +41,18 @@ class Struct:
 @pytest.mark.skipif(NUMPY_EX is not None, reason="Requires numpy")
 class TestDTypeMapping:
     PARAMS = (DTypeMapping, MutableDTypeMapping)
+    REPR = textwrap.dedent("""
+    {}(
+        a = numpy.dtype('int64'),
+        b = numpy.dtype('float64'),
+        c = numpy.dtype('<U5'),
+    )""").strip()
+    STR = textwrap.dedent("""
+    {}(
+        a = int64,
+        b = float64,
+        c = <U5,
+    )""").strip()
 
     @pytest.fixture(scope="class", autouse=True, params=PARAMS)
     def obj(self, request: _pytest.fixtures.SubRequest) -> DTypeMapping:
@@ -81,41 +85,43 @@ class TestDTypeMapping:
         assertion.ne(obj, obj_reversed)
         assertion.ne(obj, 1)
 
-    @pytest.mark.parametrize("name", "abc")
-    def test_getattr(self, obj: DTypeMapping, name: str) -> None:
-        value = getattr(obj, name)
-        assertion.eq(value, obj[name])
+    def test_getattr(self, obj: DTypeMapping) -> None:
+        for name in "abc":
+            value = getattr(obj, name)
+            assertion.eq(value, obj[name])
 
         match = f"{type(obj).__name__!r} object has no attribute 'bob'"
         with pytest.raises(AttributeError, match=match):
             del obj.bob
 
-    @pytest.mark.parametrize("name", "abc")
-    def test_setattr(self, obj: DTypeMapping, name: str) -> None:
+    def test_setattr(self, obj: DTypeMapping) -> None:
         dtype = np.dtype("S5")
         if isinstance(obj, MutableDTypeMapping):
             obj = obj.copy()
-            setattr(obj, name, dtype)
-            assertion.eq(obj[name], dtype)
-        else:
-            match1 = f"{type(obj).__name__!r} object attribute {name!r} is read-only"
-            with pytest.raises(AttributeError, match=match1):
+            for name in "abc":
                 setattr(obj, name, dtype)
+                assertion.eq(obj[name], dtype)
+        else:
+            for name in "abc":
+                match1 = f"{type(obj).__name__!r} object attribute {name!r} is read-only"
+                with pytest.raises(AttributeError, match=match1):
+                    setattr(obj, name, dtype)
 
         match2 = f"{type(obj).__name__!r} object has no attribute 'bob'"
         with pytest.raises(AttributeError, match=match2):
             obj.bob = None
 
-    @pytest.mark.parametrize("name", "abc")
-    def test_delattr(self, obj: DTypeMapping, name: str) -> None:
+    def test_delattr(self, obj: DTypeMapping) -> None:
         if isinstance(obj, MutableDTypeMapping):
             obj = obj.copy()
-            delattr(obj, name)
-            assertion.contains(obj, name, invert=True)
-        else:
-            match1 = f"{type(obj).__name__!r} object attribute {name!r} is read-only"
-            with pytest.raises(AttributeError, match=match1):
+            for name in "abc":
                 delattr(obj, name)
+                assertion.contains(obj, name, invert=True)
+        else:
+            for name in "abc":
+                match1 = f"{type(obj).__name__!r} object attribute {name!r} is read-only"
+                with pytest.raises(AttributeError, match=match1):
+                    delattr(obj, name)
 
         match2 = f"{type(obj).__name__!r} object has no attribute 'bob'"
         with pytest.raises(AttributeError, match=match2):
@@ -128,28 +134,15 @@ class TestDTypeMapping:
         assertion.issubset(obj.keys(), dir(obj))
 
     def test_repr(self, obj: DTypeMapping) -> None:
-        string1 = textwrap.dedent(f"""
-        {type(obj).__name__}(
-            a = numpy.dtype('int64'),
-            b = numpy.dtype('float64'),
-            c = numpy.dtype('<U5'),
-        )""").strip()
+        string1 = self.REPR.format(type(obj).__name__)
         assertion.str_eq(obj, string1, str_converter=repr)
 
         string2 = f"{type(obj).__name__}()"
         assertion.str_eq(type(obj)(), string2, str_converter=repr)
 
-    @pytest.mark.parametrize("str_func", [
-        str,
-        pytest.param(pretty, marks=pytest.mark.skipif(not IPYTHON, reason="Requires IPython")),
-    ], ids=["str", "pretty"])
+    @pytest.mark.parametrize("str_func", ["str", "pretty"], indirect=True)
     def test_str(self, obj: DTypeMapping, str_func: Callable[[object], str]) -> None:
-        string = textwrap.dedent(f"""
-        {type(obj).__name__}(
-            a = int64,
-            b = float64,
-            c = <U5,
-        )""").strip()
+        string = self.STR.format(type(obj).__name__)
         assertion.str_eq(obj, string, str_converter=str_func)
 
     @pytest.mark.skipif(sys.version_info < (3, 9), reason="Requires python >= 3.9")
@@ -190,12 +183,11 @@ class TestDTypeMapping:
 
 @pytest.mark.skipif(NUMPY_EX is not None, reason="Requires numpy")
 class TestMutableUserMapping:
-    @pytest.fixture(scope="class", autouse=True)
-    def obj(self, request: _pytest.fixtures.SubRequest) -> MutableDTypeMapping:
+    @pytest.fixture
+    def obj(self) -> MutableDTypeMapping:
         return MutableDTypeMapping(a="i8", b=float, c=(str, 5))
 
     def test_setitem(self, obj: MutableDTypeMapping) -> None:
-        obj = obj.copy()
         obj["d"] = (bytes, 5)
         assertion.eq(obj["d"], np.dtype("S5"))
 
@@ -206,6 +198,5 @@ class TestMutableUserMapping:
     ], ids=["dict", "BasicMapping", "Iterator"])
     def test_update(self, obj: MutableDTypeMapping, inp: _DictLike[str, npt.DTypeLike]) -> None:
         ref = DTypeMapping(a="i8", b="f8", c="u8", d="u4", e="u2", f="?")
-        obj = obj.copy()
         obj.update(inp, f="?")
         assertion.eq(obj, ref)
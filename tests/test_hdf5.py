@@ -4,7 +4,7 @@ import copy
 import pickle
 import weakref
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import Any
 from collections.abc import Iterator, Callable, KeysView, ItemsView, ValuesView
 
 import pytest
@@ -19,25 +19,23 @@ try:
 except Exception as ex:
     H5PY_EX = ex
 
-if TYPE_CHECKING:
-    import _pytest
-
 HDF5_FILE = Path('tests') / 'test_files' / 'test.hdf5'
-RAISE_MAPPING = {
-    "hash": hash,
-    "pickle": pickle.dumps,
-    "deepcopy": copy.deepcopy,
-}
+RAISE_FUNCS: list[Callable[[Any], object]] = [hash, pickle.dumps, copy.deepcopy]
+
+
+@pytest.fixture(scope="module")
+def hdf5_file() -> Iterator[h5py.File]:
+    with h5py.File(HDF5_FILE, "r") as f:
+        yield f
 
 
 @pytest.mark.skipif(H5PY_EX is not None, reason=str(H5PY_EX))
 class TestRecursiveKeys:
     @pytest.fixture(scope="class", autouse=True)
-    def view(self, request: _pytest.fixtures.SubRequest) -> Iterator[RecursiveKeysView]:
-        with h5py.File(HDF5_FILE, "r") as f:
-            ret = RecursiveKeysView(f)
-            assertion.is_(ret.mapping, f)
-            yield ret
+    def view(self, hdf5_file: h5py.File) -> RecursiveKeysView:
+        ret = RecursiveKeysView(hdf5_file)
+        assertion.is_(ret.mapping, hdf5_file)
+        return ret
 
     def test_len(self, view: RecursiveKeysView) -> None:
         assertion.len_eq(view, 3)
@@ -114,10 +112,10 @@ class TestRecursiveKeys:
         assertion.eq(view ^ {"/dset1"}, ref_set)
         assertion.eq({"/dset1"} ^ view, ref_set)
 
-    @pytest.mark.parametrize("func", RAISE_MAPPING.values(), ids=RAISE_MAPPING.keys())
-    def test_raise(self, view: RecursiveKeysView, func: Callable[[Any], object]) -> None:
-        with pytest.raises(TypeError):
-            func(view)
+    def test_raise(self, view: RecursiveKeysView) -> None:
+        for func in RAISE_FUNCS:
+            with pytest.raises(TypeError):
+                func(view)
 
     @pytest.mark.parametrize("obj", [[1], {1: 1}], ids=["list", "dict"])
     def test_init(self, view: RecursiveKeysView, obj: Any) -> None:
@@ -143,11 +141,10 @@ class TestRecursiveKeys:
 @pytest.mark.skipif(H5PY_EX is not None, reason=str(H5PY_EX))
 class TestRecursiveValues:
     @pytest.fixture(scope="class", autouse=True)
-    def view(self, request: _pytest.fixtures.SubRequest) -> Iterator[RecursiveValuesView]:
-        with h5py.File(HDF5_FILE, "r") as f:
-            ret = RecursiveValuesView(f)
-            assertion.is_(ret.mapping, f)
-            yield ret
+    def view(self, hdf5_file: h5py.File) -> RecursiveValuesView:
+        ret = RecursiveValuesView(hdf5_file)
+        assertion.is_(ret.mapping, hdf5_file)
+        return ret
 
     def test_len(self, view: RecursiveValuesView) -> None:
         assertion.len_eq(view, 3)
@@ -175,10 +172,10 @@ class TestRecursiveValues:
         with pytest.raises(TypeError):
             reversed(view)
 
-    @pytest.mark.parametrize("func", RAISE_MAPPING.values(), ids=RAISE_MAPPING.keys())
-    def test_raise(self, view: RecursiveValuesView, func: Callable[[Any], object]) -> None:
-        with pytest.raises(TypeError):
-            func(view)
+    def test_raise(self, view: RecursiveValuesView) -> None:
+        for func in RAISE_FUNCS:
+            with pytest.raises(TypeError):
+                func(view)
 
     @pytest.mark.parametrize("obj", [[1], {1: 1}], ids=["list", "dict"])
     def test_init(self, view: RecursiveValuesView, obj: Any) -> None:
@@ -204,11 +201,10 @@ class TestRecursiveValues:
 @pytest.mark.skipif(H5PY_EX is not None, reason=str(H5PY_EX))
 class TestRecursiveItems:
     @pytest.fixture(scope="class", autouse=True)
-    def view(self, request: _pytest.fixtures.SubRequest) -> Iterator[RecursiveItemsView]:
-        with h5py.File(HDF5_FILE, "r") as f:
-            ret = RecursiveItemsView(f)
-            assertion.is_(ret.mapping, f)
-            yield ret
+    def view(self, hdf5_file: h5py.File) -> RecursiveItemsView:
+        ret = RecursiveItemsView(hdf5_file)
+        assertion.is_(ret.mapping, hdf5_file)
+        return ret
 
     def test_len(self, view: RecursiveItemsView) -> None:
         assertion.len_eq(view, 3)
@@ -326,10 +322,10 @@ class TestRecursiveItems:
         assertion.eq(view ^ {("/dset1", f["/dset1"])}, ref_set)
         assertion.eq({("/dset1", f["/dset1"])} ^ view, ref_set)
 
-    @pytest.mark.parametrize("func", RAISE_MAPPING.values(), ids=RAISE_MAPPING.keys())
-    def test_raise(self, view: RecursiveItemsView, func: Callable[[Any], object]) -> None:
-        with pytest.raises(TypeError):
-            func(view)
+    def test_raise(self, view: RecursiveItemsView) -> None:
+        for func in RAISE_FUNCS:
+            with pytest.raises(TypeError):
+                func(view)
 
     @pytest.mark.parametrize("obj", [[1], {1: 1}], ids=["list", "dict"])
     def test_init(self, view: RecursiveItemsView, obj: Any) -> None:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 import sys
 import copy
 import types
@@ -9,7 +10,6 @@ import pickle
 import weakref
 import textwrap
 import subprocess
-from itertools import chain
 from typing import Any, Mapping, TYPE_CHECKING, no_type_check
 
 import pytest
@@ -33,39 +33,43 @@ MUTABLE_LAZY_IMPORT = MutableLazyImporter.from_name(__name__, IMPORTS)
 
 def all_str(dct: Mapping[Any, Any]) -> TypeGuard[Mapping[str, str]]:
     """Check that all keys and values of **dct** are strings."""
-    return all(isinstance(i, str) for i in chain.from_iterable(dct.items()))
+    return all(isinstance(k, str) and isinstance(v, str) for k, v in dct.items())
+
+
+_CODE = textwrap.dedent("""
+    >>> import pytest
+    >>> import sys
+    >>> import nanoutils
+    >>> from assertionlib import assertion
+
+    >>> __getattr__ = nanoutils.{cls_name}(
+    ...     module=nanoutils,
+    ...     imports={imports},
+    ... )
+
+    >>> assertion.issubset(
+    ...     set(__getattr__.imports.values()),
+    ...     set(sys.modules.keys()),
+    ...     invert=True,
+    ... )
+
+    >>> for name in __getattr__.imports.keys():
+    ...     assertion.truth(__getattr__(name))
+    ...     assertion.hasattr(__getattr__.module, name)
+
+    >>> with pytest.raises(AttributeError):
+    ...     __getattr__("bob")
+
+    >>> for name in __getattr__.imports.keys():
+    ...     assertion.is_(__getattr__(name), getattr(__getattr__.module, name))
+""").strip("\n")
+
+# Strip the doctest prompts once rather than on every `test_call` invocation
+_CODE_PARSED = re.sub(r"(?m)^(?:>>>|\.\.\.) ", "", _CODE) + "\n"
 
 
 @pytest.mark.parametrize("obj", [LAZY_IMPORT, MUTABLE_LAZY_IMPORT])
 class TestLazyImporter:
-    CODE = textwrap.dedent("""
-        >>> import pytest
-        >>> import sys
-        >>> import nanoutils
-        >>> from assertionlib import assertion
-
-        >>> __getattr__ = nanoutils.{cls_name}(
-        ...     module=nanoutils,
-        ...     imports={imports},
-        ... )
-
-        >>> assertion.issubset(
-        ...     set(__getattr__.imports.values()),
-        ...     set(sys.modules.keys()),
-        ...     invert=True,
-        ... )
-
-        >>> for name in __getattr__.imports.keys():
-        ...     assertion.truth(__getattr__(name))
-        ...     assertion.hasattr(__getattr__.module, name)
-
-        >>> with pytest.raises(AttributeError):
-        ...     __getattr__("bob")
-
-        >>> for name in __getattr__.imports.keys():
-        ...     assertion.is_(__getattr__(name), getattr(__getattr__.module, name))
-    """).strip("\n")
-
     def test_hash(self, obj: LazyImporter) -> None:
         if type(obj) is MutableLazyImporter:
             assertion.assert_(hash, obj, exception=TypeError)
@@ -82,7 +86,7 @@ class TestLazyImporter:
         assertion.ne(obj, obj2)
 
     def test_pickle(self, obj: LazyImporter) -> None:
-        obj2 = pickle.loads(pickle.dumps(obj))
+        obj2 = pickle.loads(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
         assertion.eq(obj, obj2)
 
     def test_weakref(self, obj: LazyImporter) -> None:
@@ -133,14 +137,17 @@ class TestLazyImporter:
         assertion.truth(cls[str])  # type: ignore[index]
 
     def test_call(self, obj: LazyImporter) -> None:
-        code = self.CODE.format(
+        code = _CODE_PARSED.format(
             cls_name=type(obj).__name__,
             module_name=obj.module.__name__,
             imports=obj.imports,
-        ) + "\n"
-        code_parsed = "\n".join((i[4:] if i else i) for i in code.split("\n"))
+        )
 
-        p = subprocess.run([sys.executable, '-c', code_parsed], capture_output=True)
+        p = subprocess.run(
+            [sys.executable, '-c', code],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
         if p.returncode:
             raise AssertionError(
                 f"Non-zero return code: {p.returncode!r}\n\n{code}\n{p.stderr.decode()}"
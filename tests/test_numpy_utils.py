@@ -0,0 +1,36 @@
+"""Tests for :mod:`nanoutils.numpy_utils`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from assertionlib import assertion
+from nanoutils import group_by_values_np
+from nanoutils.numpy_utils import NUMPY_EX
+
+if TYPE_CHECKING or NUMPY_EX is None:
+    import numpy as np
+
+pytestmark = pytest.mark.skipif(NUMPY_EX is not None, reason="Requires NumPy")
+
+
+class TestGroupByValuesNp:
+    def test_nd(self) -> None:
+        values = np.arange(8).reshape(4, 2)
+        keys = ["b", "a", "b", "a"]
+        dct = group_by_values_np(values, keys)
+
+        assertion.eq(list(dct.keys()), ["a", "b"])
+        np.testing.assert_array_equal(dct["a"], [[2, 3], [6, 7]])
+        np.testing.assert_array_equal(dct["b"], [[0, 1], [4, 5]])
+
+    def test_empty(self) -> None:
+        dct = group_by_values_np(np.array([]), np.array([]))
+        assertion.eq(dct, {})
+
+    def test_raise(self) -> None:
+        with pytest.raises(ValueError):
+            group_by_values_np(np.arange(4), np.zeros((2, 2)))
+        with pytest.raises(ValueError):
+            group_by_values_np(np.arange(4), np.arange(3))
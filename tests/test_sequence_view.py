@@ -10,7 +10,7 @@ from assertionlib import assertion
 from nanoutils import SequenceView
 
 if TYPE_CHECKING:
-    import _pytest  # noqa: F401
+    import _pytest
 
 SEQ_DICT: dict[str, Sequence[int]] = {
     "list": [0, 1, 2, 3, 4, 5],
@@ -21,13 +21,17 @@ SEQ_DICT: dict[str, Sequence[int]] = {
 }
 
 
-@pytest.mark.parametrize(
-    "seq,view", [(v, SequenceView(v)) for v in SEQ_DICT.values()],
-    ids=SEQ_DICT.keys(),
-)
 class TestSequenceView:
     """Tests for :class:`nanoutils.SequenceView`."""
 
+    @pytest.fixture(params=SEQ_DICT.keys())
+    def seq(self, request: _pytest.fixtures.SubRequest) -> Sequence[int]:
+        return SEQ_DICT[request.param]
+
+    @pytest.fixture
+    def view(self, seq: Sequence[int]) -> SequenceView[int]:
+        return SequenceView(seq)
+
     def test_hash(self, seq: Sequence[int], view: SequenceView[int]) -> None:
         assertion.eq(hash(view), hash(SequenceView(seq)))
         assertion.eq(hash(view), hash(SequenceView(view)))
@@ -45,36 +49,36 @@ class TestSequenceView:
     def test_weakref(self, seq: Sequence[int], view: SequenceView[int]) -> None:
         assertion.is_(view, weakref.ref(view)())
 
-    @pytest.mark.parametrize("i", range(0, 6, 2))
-    def test_getitem_int(self, seq: Sequence[int], view: SequenceView[int], i: int) -> None:
-        assertion.eq(view[i], seq[i])
-        assertion.isinstance(view[i], type(seq[i]))
+    def test_getitem_int(self, seq: Sequence[int], view: SequenceView[int]) -> None:
+        for i in range(0, 6, 2):
+            assertion.eq(view[i], seq[i])
+            assertion.isinstance(view[i], type(seq[i]))
 
-    @pytest.mark.parametrize("i", range(1, 6, 2))
-    def test_getitem_slice(self, seq: Sequence[int], view: SequenceView[int], i: int) -> None:
-        assertion.eq(view[:i], seq[:i])
-        assertion.eq(view[i:], seq[i:])
-        assertion.eq(view[::i], seq[::i])
+    def test_getitem_slice(self, seq: Sequence[int], view: SequenceView[int]) -> None:
+        for i in range(1, 6, 2):
+            assertion.eq(view[:i], seq[:i])
+            assertion.eq(view[i:], seq[i:])
+            assertion.eq(view[::i], seq[::i])
         assertion.isinstance(view[:], SequenceView)
 
-    @pytest.mark.parametrize("i", range(0, 6, 2))
-    def test_index(self, seq: Sequence[int], view: SequenceView[int], i: int) -> None:
-        assertion.eq(view.index(i), seq.index(i))
+    def test_index(self, seq: Sequence[int], view: SequenceView[int]) -> None:
+        for i in range(0, 6, 2):
+            assertion.eq(view.index(i), seq.index(i))
 
-    @pytest.mark.parametrize("i", range(0, 6, 2))
-    def test_count(self, seq: Sequence[int], view: SequenceView[int], i: int) -> None:
-        assertion.eq(view.count(i), seq.count(i))
+    def test_count(self, seq: Sequence[int], view: SequenceView[int]) -> None:
+        for i in range(0, 6, 2):
+            assertion.eq(view.count(i), seq.count(i))
 
     def test_len(self, seq: Sequence[int], view: SequenceView[int]) -> None:
         assertion.eq(len(view), len(seq))
 
-    @pytest.mark.parametrize("i", range(0, 6, 2))
-    def test_contains(self, seq: Sequence[int], view: SequenceView[int], i: int) -> None:
-        assertion.contains(view, i)
-        assertion.eq(i in view, i in seq)
+    def test_contains(self, seq: Sequence[int], view: SequenceView[int]) -> None:
+        for i in range(0, 6, 2):
+            assertion.contains(view, i)
+            assertion.eq(i in view, i in seq)
 
     def test_iter(self, seq: Sequence[int], view: SequenceView[int]) -> None:
-        assertion.eq(list(iter(view)), list(iter(seq)))
+        assertion.eq(list(view), list(seq))
 
     def test_reversed(self, seq: Sequence[int], view: SequenceView[int]) -> None:
         assertion.eq(list(reversed(view)), list(reversed(seq)))
@@ -17,16 +17,28 @@ from nanoutils._user_dict import _DictLike
 if TYPE_CHECKING:
     import _pytest
 
-try:
-    from IPython.lib.pretty import pretty
-except ModuleNotFoundError:
-    IPYTHON: bool = False
-    pretty = NotImplemented
-else:
-    IPYTHON = True
+ITEMS12 = list(zip(string.ascii_lowercase[:12], range(12)))
+REPR12 = textwrap.dedent("""
+    {}({{
+        'a': 0,
+        'b': 1,
+        'c': 2,
+        'd': 3,
+        'e': 4,
+        'f': 5,
+        'g': 6,
+        'h': 7,
+        'i': 8,
+        'j': 9,
+        'k': 10,
+        'l': 11,
+    }})
+""").strip()
 
 
 class BasicMapping:
+    __slots__ = ("_dict",)
+
     def __init__(self, dct: dict[str, int]) -> None:
         self._dict = dct
 
@@ -37,11 +49,15 @@ class BasicMapping:
         return self._dict[key]
 
 
-@pytest.mark.parametrize("obj", [
-    UserMapping(a=0, b=1, c=2),
-    MutableUserMapping(a=0, b=1, c=2),
-], ids=["UserMapping", "MutableUserMapping"])
 class TestUserMapping:
+    @pytest.fixture(
+        params=[UserMapping, MutableUserMapping],
+        ids=["UserMapping", "MutableUserMapping"],
+    )
+    def obj(self, request: _pytest.fixtures.SubRequest) -> UserMapping[str, int]:
+        cls: type[UserMapping[str, int]] = request.param
+        return cls(a=0, b=1, c=2)
+
     @pytest.mark.parametrize("inp", [
         {"a": 0, "b": 1, "c": 2},
         BasicMapping({"a": 0, "b": 1, "c": 2}),
@@ -54,7 +70,7 @@ class TestUserMapping:
             assertion.eq(cls(**inp), obj)  # type: ignore[arg-type]
 
     def test_pickle(self, obj: UserMapping[str, int]) -> None:
-        out = pickle.loads(pickle.dumps(obj))
+        out = pickle.loads(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
         assertion.eq(out, obj)
 
     def test_weakref(self, obj: UserMapping[str, int]) -> None:
@@ -66,9 +82,14 @@ class TestUserMapping:
         assertion.eq(out, obj)
 
     def test_deepcopy(self, obj: UserMapping[str, int]) -> None:
-        out = copy.deepcopy(obj)
-        assertion.eq(out, obj)
-        assertion.is_not(out._dict, obj._dict)
+        cls: type[UserMapping[str, list[int]]] = type(obj)  # type: ignore[assignment]
+        obj2 = cls(a=[0], b=[1], c=[2])
+        memo: dict[int, object] = {}
+        out = copy.deepcopy(obj2, memo)
+        assertion.eq(out, obj2)
+        assertion.is_not(out._dict, obj2._dict)
+        assertion.is_not(out["a"], obj2["a"])
+        assertion.is_(memo[id(obj2)], out)
 
     def test_copy_meth(self, obj: UserMapping[str, int]) -> None:
         out = obj.copy()
@@ -83,37 +104,19 @@ class TestUserMapping:
     def test_getitem(self, obj: UserMapping[str, int], key: str, value: int) -> None:
         assertion.eq(obj[key], value)
 
-    @pytest.mark.parametrize("str_func", [
-        str,
-        repr,
-        pytest.param(pretty, marks=pytest.mark.skipif(not IPYTHON, reason="Requires IPython")),
-    ], ids=["str", "repr", "pretty"])
+    @pytest.mark.parametrize("str_func", ["str", "repr", "pretty"], indirect=True)
     def test_repr(self, obj: UserMapping[str, int], str_func: Callable[[object], str]) -> None:
         string1 = f"{type(obj).__name__}({{'a': 0, 'b': 1, 'c': 2}})"
         assertion.str_eq(obj, string1, str_converter=str_func)
 
         cls = type(obj)
-        ref2 = cls(zip(string.ascii_lowercase[:12], range(12)))
-        string2 = textwrap.dedent(f"""
-        {cls.__name__}({{
-            'a': 0,
-            'b': 1,
-            'c': 2,
-            'd': 3,
-            'e': 4,
-            'f': 5,
-            'g': 6,
-            'h': 7,
-            'i': 8,
-            'j': 9,
-            'k': 10,
-            'l': 11,
-        }})
-        """).strip()
+        ref2 = cls(ITEMS12)
+        string2 = REPR12.format(cls.__name__)
         assertion.str_eq(ref2, string2, str_converter=str_func)
 
-    @pytest.mark.skipif(not IPYTHON, reason="Rquires IPython")
-    def test_pretty_repr(self, obj: UserMapping[str, int]) -> None:
+    def test_pretty_repr(
+        self, obj: UserMapping[str, int], pretty: Callable[[object], str]
+    ) -> None:
         string1 = f"{type(obj).__name__}({{'a': 0, 'b': 1, 'c': 2}})"
         assertion.str_eq(obj, string1, str_converter=pretty)
 
@@ -191,7 +194,6 @@ class TestUserMapping:
     def test_ior(self, obj: UserMapping[str, int]) -> None:
         b = {"c": 3, "d": 4, "e": 5}
         if isinstance(obj, MutableUserMapping):
-            obj = obj.copy()
             obj |= b
             assertion.eq(obj, {"a": 0, "b": 1, "c": 3, "d": 4, "e": 5})
         else:
@@ -202,31 +204,26 @@ class TestUserMapping:
 
 
 class TestMutableUserMapping:
-    @pytest.fixture(scope="class", autouse=True)
-    def obj(self, request: _pytest.fixtures.SubRequest) -> MutableUserMapping[str, int]:
+    @pytest.fixture
+    def obj(self) -> MutableUserMapping[str, int]:
         return MutableUserMapping({"a": 0, "b": 1, "c": 2})
 
     def test_setitem(self, obj: MutableUserMapping[str, int]) -> None:
-        obj = obj.copy()
         obj["d"] = 3
         assertion.eq(obj["d"], 3)
 
     def test_delitem(self, obj: MutableUserMapping[str, int]) -> None:
-        obj = obj.copy()
         del obj["a"]
         assertion.eq(obj, {"b": 1, "c": 2})
 
     def test_clear(self, obj: MutableUserMapping[str, int]) -> None:
-        obj = obj.copy()
         obj.clear()
         assertion.eq(obj, {})
 
     def test_popitem(self, obj: MutableUserMapping[str, int]) -> None:
-        obj = obj.copy()
         assertion.eq(obj.popitem(), ("c", 2))
 
     def test_pop(self, obj: MutableUserMapping[str, int]) -> None:
-        obj = obj.copy()
         assertion.eq(obj.pop("c"), 2)
         assertion.eq(obj, {"a": 0, "b": 1})
         with pytest.raises(KeyError):
@@ -239,6 +236,5 @@ class TestMutableUserMapping:
         [("d", 3), ("e", 4), ("f", 5)],
     ], ids=["dict", "BasicMapping", "Iterable"])
     def test_update(self, obj: MutableUserMapping[str, int], inp: _DictLike[str, int]) -> None:
-        obj = obj.copy()
         obj.update(inp, g=6)
         assertion.eq(obj, {"a": 0, "b": 1, "c": 2, "d": 3, "e": 4, "f": 5, "g": 6})
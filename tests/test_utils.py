@@ -1,11 +1,32 @@
 """Tests for :mod:`nanoutils.utils`."""
 
+from __future__ import annotations
+
+import os
+import json
 import sys
+import types
+import warnings
+import textwrap
+from typing import Any
+from pathlib import Path
 from inspect import isclass
 from functools import partial
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
 
+import pytest
 from assertionlib import assertion
-from nanoutils import set_docstring, get_importable, VersionInfo, split_dict
+from nanoutils import (
+    set_docstring,
+    get_importable,
+    get_func_name,
+    ignore_if,
+    VersionInfo,
+    split_dict,
+    construct_api_doc,
+    PartialPrepend,
+)
 
 
 def test_set_docstring() -> None:
@@ -23,6 +44,34 @@ def test_set_docstring() -> None:
     assertion.eq(func2.__doc__, None)
 
 
+def test_get_func_name() -> None:
+    """Tests for :func:`nanoutils.get_func_name`."""
+    class QualnameOnly:
+        def __init__(self) -> None:
+            self.__qualname__ = "qualname"
+
+        def __call__(self) -> None:
+            pass
+
+        def __repr__(self) -> str:
+            return "<QualnameOnly>"
+
+    ns: dict[str, Any] = {"__name__": None}
+    exec("def func(): pass", ns)
+    func = ns["func"]
+    func.__module__ = None
+
+    assertion.eq(get_func_name(len), "len")
+    assertion.eq(get_func_name(len, prepend_module=True), "builtins.len")
+    assertion.eq(get_func_name(OrderedDict.copy), "OrderedDict.copy")
+    assertion.eq(get_func_name(func), "func")
+    assertion.eq(get_func_name(func, prepend_module=True), "None.func")
+    assertion.eq(get_func_name(partial(len)), "partial(...)")
+    assertion.eq(get_func_name(QualnameOnly()), "QualnameOnly(...)")
+    assertion.eq(get_func_name(QualnameOnly(), repr_fallback=True), "<QualnameOnly>")
+    assertion.assert_(get_func_name, 1, exception=TypeError)
+
+
 def test_get_importable() -> None:
     """Tests for :func:`nanoutils.get_importable`."""
     class Test:
@@ -30,6 +79,16 @@ def test_get_importable() -> None:
 
     assertion.is_(get_importable('builtins.dict'), dict)
     assertion.is_(get_importable('builtins.dict', validate=isclass), dict)
+    assertion.is_(get_importable('os.path'), os.path)
+    assertion.is_(get_importable('os.path.join'), os.path.join)
+    assertion.is_(get_importable('collections.OrderedDict.copy'), OrderedDict.copy)
+    assertion.eq(get_importable('collections.OrderedDict.copy.__name__'), 'copy')
+    assertion.is_(
+        get_importable('json.decoder.JSONDecoder.decode.__doc__'),
+        json.decoder.JSONDecoder.decode.__doc__,
+    )
+    assertion.eq(get_importable('typing.Dict.__origin__.fromkeys'), dict.fromkeys)
+    assertion.assert_(get_importable, 'nanoutils_nonexistent.a.b', exception=ModuleNotFoundError)
 
     assertion.assert_(get_importable, None, exception=TypeError)
     assertion.assert_(get_importable, Test, exception=TypeError)
@@ -38,6 +97,82 @@ def test_get_importable() -> None:
                       exception=RuntimeError)
 
 
+def test_get_importable_live(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that :func:`nanoutils.get_importable` reflects changes to imported modules."""
+    module = types.ModuleType("_nanoutils_test_module")
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+
+    module.x = 1  # type: ignore[attr-defined]
+    assertion.eq(get_importable(f"{module.__name__}.x"), 1)
+    module.x = 2  # type: ignore[attr-defined]
+    assertion.eq(get_importable(f"{module.__name__}.x"), 2)
+
+
+@pytest.fixture
+def tmp_package(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    name = "_nanoutils_test_pkg"
+    pkg = tmp_path / name
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text(textwrap.dedent("""
+        def shadow():
+            pass
+        shadow.attr = "function"
+    """))
+    (pkg / "shadow.py").write_text('attr = "module"\n')
+    (pkg / "sub.py").write_text('attr = "module"\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    try:
+        yield name
+    finally:
+        for key in [k for k in sys.modules if k == name or k.startswith(f"{name}.")]:
+            del sys.modules[key]
+
+
+def test_get_importable_submodule(tmp_package: str) -> None:
+    """Test :func:`nanoutils.get_importable` with (shadowed) submodules."""
+    # A package attribute takes precedence over a submodule of the same name
+    assertion.eq(get_importable(f"{tmp_package}.shadow.attr"), "function")
+    pkg = sys.modules[tmp_package]
+    assertion.isinstance(pkg.shadow, types.FunctionType)
+    assertion.contains(sys.modules, f"{tmp_package}.shadow", invert=True)
+
+    # Submodules not imported by their parent package are imported on demand
+    assertion.eq(get_importable(f"{tmp_package}.sub.attr"), "module")
+    assertion.assert_(get_importable, f"{tmp_package}.bob", exception=AttributeError)
+
+
+def test_ignore_if() -> None:
+    """Tests for :func:`nanoutils.ignore_if`."""
+    exception = ImportError("test")
+
+    @ignore_if(exception)
+    def func() -> None:
+        pass
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", UserWarning)
+        try:
+            raise KeyError("a")
+        except KeyError:
+            with pytest.raises(UserWarning) as rec1:
+                func()
+        with pytest.raises(UserWarning) as rec2:
+            func()
+
+    ex1, ex2 = rec1.value, rec2.value
+    assertion.is_not(ex1, ex2)
+    assertion.is_(ex1.__cause__, exception)
+    assertion.is_(ex2.__cause__, exception)
+    assertion.isinstance(ex1.__context__, KeyError)
+    assertion.is_(ex2.__context__, None)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        assertion.is_(func(), None)
+    assertion.is_(ignore_if(None)(func), func)
+    assertion.assert_(ignore_if, 1, exception=TypeError)
+
+
 def test_version_info() -> None:
     """Tests for :func:`nanoutils.VersionInfo`."""
     tup1 = VersionInfo(0, 1, 2)
@@ -49,45 +184,104 @@ def test_version_info() -> None:
     assertion.eq(tup1.micro, tup1.bug)
     assertion.eq(tup1.micro, tup1.maintenance)
 
+    assertion.eq(VersionInfo.from_str('1.2'), (1, 2, 0))
+    assertion.eq(VersionInfo.from_str('1.2.3.4'), (1, 2, 3))
+    assertion.eq(VersionInfo.from_str('v1.2.3rc1'), (1, 2, 3))
+    assertion.eq(VersionInfo.from_str('v1.2rc1'), (1, 2, 0))
+    assertion.eq(VersionInfo.from_str('1.2.3rc1', fullmatch=False), (1, 2, 3))
+
     assertion.assert_(VersionInfo.from_str, b'0.1.2', exception=TypeError)
     assertion.assert_(VersionInfo.from_str, '0.1.2bob', exception=ValueError)
 
 
-def test_split_dict() -> None:
-    """Test :func:`nanoutils.split_dict`."""
-    dct1 = {1: 1, 2: 2, 3: 3, 4: 4, 5: 5}
-    dct2 = dct1.copy()
-    dct3 = dct1.copy()
-    dct4 = dct1.copy()
-    dct5 = dct1.copy()
-    dct6 = dct1.copy()
-    dct7 = dct1.copy()
-    dct8 = dct1.copy()
-
-    ref1 = {1: 1, 2: 2}
-    ref2 = {3: 3, 4: 4, 5: 5}
-
-    split_dict(dct1, keep_keys=[1, 2])
-    split_dict(dct2, keep_keys={1, 2})
-    split_dict(dct3, keep_keys=iter({1, 2}))
-    split_dict(dct4, keep_keys=[1, 2], preserve_order=True)
-    assertion.eq(dct1, ref1)
-    assertion.eq(dct2, ref1)
-    assertion.eq(dct3, ref1)
-    assertion.eq(dct4, ref1)
-    if sys.version_info[1] > 6:
-        assertion.eq(list(dct4.keys()), [1, 2])
-
-    split_dict(dct5, disgard_keys=[1, 2])
-    split_dict(dct6, disgard_keys={1, 2})
-    split_dict(dct7, disgard_keys=iter({1, 2}))
-    split_dict(dct8, disgard_keys=[1, 2], preserve_order=True)
-    assertion.eq(dct5, ref2)
-    assertion.eq(dct6, ref2)
-    assertion.eq(dct7, ref2)
-    assertion.eq(dct8, ref2)
-    if sys.version_info[1] > 6:
-        assertion.eq(list(dct8.keys()), [3, 4, 5])
+@pytest.fixture
+def dct() -> dict[int, int]:
+    return {1: 1, 2: 2, 3: 3, 4: 4, 5: 5}
+
+
+@pytest.mark.parametrize("keys_func", [list, set, iter, reversed])
+@pytest.mark.parametrize("preserve_order", [False, True])
+def test_split_dict_keep(
+    dct: dict[int, int],
+    keys_func: Callable[[list[int]], Iterable[int]],
+    preserve_order: bool,
+) -> None:
+    """Test :func:`nanoutils.split_dict` with ``keep_keys``."""
+    split_dict(dct, keep_keys=keys_func([1, 2]), preserve_order=preserve_order)
+    assertion.eq(dct, {1: 1, 2: 2})
+    if preserve_order:
+        assertion.eq(list(dct.keys()), [1, 2])
+
+
+@pytest.mark.parametrize("keys_func", [list, set, iter, reversed])
+@pytest.mark.parametrize("preserve_order", [False, True])
+def test_split_dict_disgard(
+    dct: dict[int, int],
+    keys_func: Callable[[list[int]], Iterable[int]],
+    preserve_order: bool,
+) -> None:
+    """Test :func:`nanoutils.split_dict` with ``disgard_keys``."""
+    split_dict(dct, disgard_keys=keys_func([1, 2]), preserve_order=preserve_order)
+    assertion.eq(dct, {3: 3, 4: 4, 5: 5})
+    if preserve_order:
+        assertion.eq(list(dct.keys()), [3, 4, 5])
+
+
+class ListKeysDict(dict):  # type: ignore[type-arg]
+    def keys(self) -> list[Any]:  # type: ignore[override]
+        return list(super().keys())
+
 
+@pytest.mark.parametrize("preserve_order", [False, True])
+def test_split_dict_list_keys(preserve_order: bool) -> None:
+    """Test :func:`nanoutils.split_dict` with a mapping whose ``keys()`` is not a set."""
+    dct1 = ListKeysDict({1: 1, 2: 2, 3: 3})
+    dct2 = ListKeysDict({1: 1, 2: 2, 3: 3})
+    split_dict(dct1, keep_keys=[1], preserve_order=preserve_order)
+    split_dict(dct2, disgard_keys=[1], preserve_order=preserve_order)
+    assertion.eq(dct1, {1: 1})
+    assertion.eq(dct2, {2: 2, 3: 3})
+
+
+def test_split_dict_raise() -> None:
+    """Test :func:`nanoutils.split_dict` with invalid arguments."""
     assertion.assert_(split_dict, {}, exception=TypeError)
     assertion.assert_(split_dict, {}, keep_keys=[], disgard_keys=[], exception=TypeError)
+
+
+def test_construct_api_doc() -> None:
+    """Test :func:`nanoutils.construct_api_doc`."""
+    def func():
+        pass
+
+    glob_dict = {
+        '__doc__': '{autosummary}\n{autofunction}',
+        '__all__': ['func', 'dict', 'TypeError', 'os'],
+        'func': func,
+        'dict': dict,
+        'TypeError': TypeError,
+        'os': os,
+    }
+    ref = (
+        '    func\n    dict\n    TypeError\n    os\n'
+        '.. autodecorator:: func\n'
+        '.. autoclass:: dict\n    :members:\n'
+        '.. autoexception:: TypeError\n'
+        '.. automodule:: os'
+    )
+    assertion.eq(construct_api_doc(glob_dict, decorators={'func'}), ref)
+    assertion.eq(construct_api_doc(glob_dict, decorators=['func']), ref)
+
+
+def test_partial_prepend() -> None:
+    """Test :class:`nanoutils.PartialPrepend`."""
+    func1 = PartialPrepend(dict, a=1)
+    func2 = PartialPrepend(isinstance, int)
+
+    assertion.eq(func1(), {'a': 1})
+    assertion.eq(func1(b=2), {'a': 1, 'b': 2})
+    assertion.eq(func1(a=2), {'a': 2})
+    assertion.eq(func1(self=1), {'a': 1, 'self': 1})
+    assertion.eq(func1.keywords, {'a': 1})
+    assertion.is_(func2(1), True)
+    assertion.is_(func2(1.0), False)
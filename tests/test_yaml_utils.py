@@ -0,0 +1,31 @@
+"""Tests for :mod:`nanoutils.yaml_utils`."""
+
+from __future__ import annotations
+
+import pytest
+from assertionlib import assertion
+from nanoutils import UniqueLoader
+from nanoutils.yaml_utils import YAML_EX
+
+if YAML_EX is None:
+    import yaml
+
+pytestmark = pytest.mark.skipif(YAML_EX is not None, reason="Requires PyYAML")
+
+
+class TestUniqueLoader:
+    def test_load(self) -> None:
+        out = yaml.load("a: 0\nb: [1, 2]\nc: {d: 3}\n", Loader=UniqueLoader)
+        assertion.eq(out, {"a": 0, "b": [1, 2], "c": {"d": 3}})
+
+    def test_duplicate_key(self) -> None:
+        with pytest.raises(yaml.constructor.ConstructorError, match="found a duplicate key"):
+            yaml.load("a: 0\na: 1\n", Loader=UniqueLoader)
+
+    @pytest.mark.parametrize("string", [
+        "[1]: 1\n",
+        "!!python/tuple [[1]]: 1\n",
+    ], ids=["list", "tuple"])
+    def test_unhashable_key(self, string: str) -> None:
+        with pytest.raises(yaml.constructor.ConstructorError, match="found unhashable key"):
+            yaml.load(string, Loader=UniqueLoader)